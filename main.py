@@ -1,7 +1,9 @@
 import os
+from operator import itemgetter
 from jira import JIRA
 from typing import List, Dict, Any, Optional
-import pandas as pd
+from openpyxl import Workbook
+from openpyxl.utils import get_column_letter
 
 class JiraAnalyticsTool:
     def __init__(self, jira_server=None, username=None, api_token=None, 
@@ -95,9 +97,9 @@ class JiraAnalyticsTool:
                 maxResults=max_results,
                 fields=[
                     'summary', 'status', 'priority', 'issuetype', 'created', 
-                    'updated', 'resolved', 'assignee', 'reporter', 
-                    'project', 'fixVersion', 'components', 'labels', 
-                    'environment', 'resolution', 'timeSpent'
+                    'updated', 'resolutiondate', 'assignee', 'reporter', 
+                    'project', 'fixVersions', 'components', 'labels', 
+                    'environment', 'resolution', 'timespent'
                 ]
             )
             return [self._format_issue(issue) for issue in issues]
@@ -129,10 +131,10 @@ class JiraAnalyticsTool:
             'project': str(issue.fields.project),
             'fixVersion': ', '.join([str(v) for v in issue.fields.fixVersions]) if issue.fields.fixVersions else None,
             'component': ', '.join([str(c) for c in issue.fields.components]) if issue.fields.components else None,
-            'labels': issue.fields.labels,
+            'labels': ', '.join(issue.fields.labels) if issue.fields.labels else None,
             'environment': getattr(issue.fields, 'environment', None),
             'resolution': str(issue.fields.resolution) if issue.fields.resolution else None,
-            'timeSpent': getattr(issue.fields, 'timeSpent', None)
+            'timeSpent': getattr(issue.fields, 'timespent', None)
         }
 
     def export_to_excel(self, issues: List[Dict[str, Any]], filename: str = 'jira_issues.xlsx'):
@@ -144,8 +146,22 @@ class JiraAnalyticsTool:
             filename (str): Output Excel filename
         """
         try:
-            df = pd.DataFrame(issues)
-            df.to_excel(filename, index=False)
+            headers = list(issues[0].keys()) if issues else []
+            
+            # Write-only workbooks stream appended rows instead of building a Cell per value
+            wb = Workbook(write_only=True)
+            ws = wb.create_sheet('Issues')
+            # Column widths must be set before the first row is appended
+            for column in range(1, len(headers) + 1):
+                ws.column_dimensions[get_column_letter(column)].width = 20
+            if headers:
+                ws.append(headers)
+                # Every formatted issue carries all of the columns above, so a
+                # single itemgetter reads a whole row as a tuple in one call
+                get_row = itemgetter(*headers)
+                for issue in issues:
+                    ws.append(get_row(issue))
+            wb.save(filename)
             print(f"Issues exported to {filename}")
         except Exception as e:
             print(f"Error exporting to Excel: {e}")
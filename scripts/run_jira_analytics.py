@@ -2,6 +2,7 @@
 
 import sys
 import os
+import argparse
 
 # Ensure the project root is in the Python path
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
@@ -9,8 +10,15 @@ sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')
 from src.jira_analytics import JiraAnalyticsTool
 
 def main():
+    parser = argparse.ArgumentParser(description="Fetch Jira issues with a JQL query")
+    parser.add_argument('--no-cache', action='store_true', 
+                        help="Always query Jira instead of reusing cached search results")
+    parser.add_argument('--include-text', action='store_true', 
+                        help="Also fetch issue descriptions and environments, exported to a 'Text' sheet")
+    args = parser.parse_args()
+    
     # Create Jira Analytics Tool instance
-    jira_tool = JiraAnalyticsTool()
+    jira_tool = JiraAnalyticsTool(cache_dir=None) if args.no_cache else JiraAnalyticsTool()
     
     # Prompt for JQL query
     jql_query = input("Enter your JQL query: ").strip()
@@ -24,13 +32,15 @@ def main():
         max_issues = None
     
     # Fetch issues
-    issues = jira_tool.fetch_issues(jql_query, max_issues)
+    issues = jira_tool.fetch_issues(jql_query, max_issues, include_text=args.include_text)
     
     # Print issues
     if issues:
         print(f"\nFetched {len(issues)} issues:")
-        for issue in issues:
-            print(f"Issue Key: {issue['issueKey']} - Summary: {issue['summary']}")
+        # One buffered write instead of a print call per issue
+        sys.stdout.writelines(
+            f"Issue Key: {issue['Issue Key']} - Summary: {issue['Summary']}\n" for issue in issues
+        )
         
         # Export to Excel option
         export_choice = input("\nDo you want to export issues to Excel? (y/n): ").strip().lower()
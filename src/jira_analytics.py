@@ -1,14 +1,195 @@
 import os
 import sys
+import hashlib
+import json
+import tempfile
+import time
+from collections import deque
+from contextlib import contextmanager
+from concurrent.futures import Future, ThreadPoolExecutor
+from itertools import chain, islice
+from operator import itemgetter
 from jira import JIRA
-from typing import List, Dict, Any, Optional
+from requests.adapters import HTTPAdapter
+from typing import List, Dict, Any, Optional, Tuple, Union, Callable, Iterable, Iterator, TextIO
+from urllib3.util.retry import Retry
 import pandas as pd
+import xlsxwriter
+
+# Jira fields requested for every issue
+_ISSUE_FIELDS = (
+    'summary', 'status', 'priority', 'issuetype', 'created', 
+    'updated', 'resolutiondate', 'assignee', 'reporter', 
+    'project', 'fixVersions', 'components', 'labels', 
+    'environment', 'resolution', 'timespent', 'description'
+)
+# Long free-text fields, only requested when issue text is included
+_TEXT_FIELDS = frozenset({'description', 'environment'})
+# search_issues rewrites a fields list in place, so pass a string it can split
+_FIELDS_STR = ','.join(_ISSUE_FIELDS)
+_SUMMARY_FIELDS_STR = ','.join(field for field in _ISSUE_FIELDS if field not in _TEXT_FIELDS)
+# Default location of cached search results
+_DEFAULT_CACHE_DIR = os.path.join('~', '.cache', 'jira_analytics')
+# Fields whose values are lists and are exported comma-joined
+_LIST_FIELDS = frozenset({'fixVersions', 'components', 'labels'})
+
+def _value_source(field: str, key: Optional[str], empty: str, strict: bool = True) -> str:
+    """
+    Build the source of an expression reading one formatted value from 'fields'
+    
+    This is the single definition of how raw Jira fields are formatted:
+    nested resources show their display value, lists are comma-joined and
+    null fields fall back to their empty value.
+    
+    Args:
+        field (str): Jira field id
+        key (Optional[str]): Key holding the display value of nested resources
+        empty (str): Value used when the field is unset
+        strict (bool): Raise KeyError for missing keys instead of treating them as unset
+    
+    Returns:
+        str: Python expression reading the raw 'fields' dict
+    """
+    value = f"fields[{field!r}]" if strict else f"fields.get({field!r})"
+    if field in _LIST_FIELDS:
+        item = (f"item[{key!r}]" if strict else f"item.get({key!r}, '')") if key else "item"
+        display = f"', '.join([{item} for item in value])"
+    elif key:
+        display = f"value[{key!r}]" if strict else f"value.get({key!r}, {empty!r})"
+    else:
+        display = "value"
+    # Only null means unset, so numeric values such as a time spent of 0 are kept
+    return f"({display} if (value := {value}) is not None else {empty!r})"
+
+def _compile(source: str, name: str) -> Callable:
+    """
+    Compile generated source and return the function it defines
+    
+    Args:
+        source (str): Source of a single function definition
+        name (str): Name of the defined function
+    
+    Returns:
+        Callable: Compiled function
+    """
+    namespace = {}
+    exec(compile(source, f'<{name}>', 'exec'), namespace)
+    return namespace[name]
+
+def _compile_formatter(fields_key_map: Tuple[Tuple[str, str, Optional[str], str], ...]) -> Callable[[Dict[str, Any]], Dict[str, Any]]:
+    """
+    Generate a function formatting one raw issue for a fixed set of fields
+    
+    The function is built as source from the field map and compiled once,
+    so formatting an issue is a single straight-line dict display with no
+    loops or per-field calls. If a field is absent from the response it
+    falls back to tolerant lookups for that issue.
+    
+    Args:
+        fields_key_map (Tuple[Tuple[str, str, Optional[str], str], ...]): Output column,
+            Jira field id, display value key and empty value of every formatted field
+    
+    Returns:
+        Callable[[Dict[str, Any]], Dict[str, Any]]: Formatter taking the raw issue JSON
+    """
+    def display(strict: bool) -> str:
+        items = ["'Issue Key': issue['key']"] + [
+            f"{column!r}: {_value_source(field, key, empty, strict)}"
+            for column, field, key, empty in fields_key_map
+        ]
+        return "{\n" + ''.join(f"            {item},\n" for item in items) + "        }"
+    
+    return _compile(
+        "def format_issue(issue):\n"
+        "    fields = issue['fields']\n"
+        "    try:\n"
+        f"        return {display(True)}\n"
+        "    except KeyError:\n"
+        "        # Some fields are missing from the response, use tolerant lookups instead\n"
+        f"        return {display(False)}\n",
+        'format_issue'
+    )
+
+def _compile_column(field: str, key: Optional[str], empty: str) -> Callable[[List[Dict[str, Any]]], List[Any]]:
+    """
+    Generate a function formatting one field of many issues as a column
+    
+    Args:
+        field (str): Jira field id
+        key (Optional[str]): Key holding the display value of nested resources
+        empty (str): Value used when the field is unset
+    
+    Returns:
+        Callable[[List[Dict[str, Any]]], List[Any]]: Column builder taking the raw 'fields' dicts
+    """
+    return _compile(
+        "def build_column(issue_fields):\n"
+        "    try:\n"
+        f"        return [{_value_source(field, key, empty)} for fields in issue_fields]\n"
+        "    except KeyError:\n"
+        "        # Some issues lack this field, use tolerant lookups for the column\n"
+        f"        return [{_value_source(field, key, empty, strict=False)} for fields in issue_fields]\n",
+        'build_column'
+    )
+
+def _row_getter(keys: List[Any]) -> Callable[[Any], tuple]:
+    """
+    Build a function reading several keys or indices of a row at once
+    
+    Args:
+        keys (List[Any]): Dictionary keys or sequence indices to read
+    
+    Returns:
+        Callable[[Any], tuple]: Getter returning the values as a tuple, even for a single key
+    """
+    if len(keys) == 1:
+        get = itemgetter(keys[0])
+        return lambda row: (get(row),)
+    return itemgetter(*keys)
 
 class JiraAnalyticsTool:
+    # Output column -> (Jira field id, key holding the display value of nested resources, value when unset)
+    _FIELDS_KEY_MAP = (
+        ('Summary', 'summary', None, ''),
+        ('Description', 'description', None, ''),
+        ('Status', 'status', 'name', ''),
+        ('Priority', 'priority', 'name', ''),
+        ('Issue Type', 'issuetype', 'name', ''),
+        ('Created Date', 'created', None, ''),
+        ('Updated Date', 'updated', None, ''),
+        ('Resolved Date', 'resolutiondate', None, ''),
+        ('Assignee', 'assignee', 'displayName', 'Unassigned'),
+        ('Reporter', 'reporter', 'displayName', ''),
+        ('Project', 'project', 'key', ''),
+        ('Fix Versions', 'fixVersions', 'name', ''),
+        ('Components', 'components', 'name', ''),
+        ('Labels', 'labels', None, ''),
+        ('Environment', 'environment', None, ''),
+        ('Resolution', 'resolution', 'name', ''),
+        ('Time Spent', 'timespent', None, '')
+    )
+    # Same without the long text columns, for issues fetched without their text
+    _SUMMARY_FIELDS_KEY_MAP = tuple(entry for entry in _FIELDS_KEY_MAP if entry[1] not in _TEXT_FIELDS)
+    # Generated straight-line formatters for each field set
+    _FORMATTER = staticmethod(_compile_formatter(_FIELDS_KEY_MAP))
+    _SUMMARY_FORMATTER = staticmethod(_compile_formatter(_SUMMARY_FIELDS_KEY_MAP))
+    # Output column -> generated builder formatting a whole column, for the DataFrame path
+    _COLUMN_BUILDERS = tuple(
+        (column, _compile_column(field, key, empty)) for column, field, key, empty in _FIELDS_KEY_MAP
+    )
+    _SUMMARY_COLUMN_BUILDERS = tuple(
+        (column, _compile_column(field, key, empty)) for column, field, key, empty in _SUMMARY_FIELDS_KEY_MAP
+    )
+    # Output columns holding long text, exported to their own sheet
+    _TEXT_COLUMNS = frozenset(column for column, field, _, _ in _FIELDS_KEY_MAP if field in _TEXT_FIELDS)
+
     def __init__(self, 
                  jira_server: Optional[str] = None, 
                  username: Optional[str] = None, 
-                 api_token: Optional[str] = None):
+                 api_token: Optional[str] = None,
+                 max_workers: int = 5,
+                 cache_dir: Optional[str] = _DEFAULT_CACHE_DIR,
+                 cache_ttl: int = 3600):
         """
         Initialize Jira connection 
         
@@ -16,11 +197,17 @@ class JiraAnalyticsTool:
             jira_server (Optional[str]): Jira server URL
             username (Optional[str]): Jira username
             api_token (Optional[str]): Jira API token
+            max_workers (int): Number of search pages fetched concurrently
+            cache_dir (Optional[str]): Directory for cached search results, None to disable caching
+            cache_ttl (int): Number of seconds cached search results stay valid
         """
         # Use provided credentials or fall back to environment variables
         self.jira_server = jira_server or os.getenv('JIRA_SERVER', 'https://your-jira-instance.atlassian.net')
         self.username = username or os.getenv('JIRA_USERNAME')
         self.api_token = api_token or os.getenv('JIRA_API_TOKEN')
+        self.max_workers = max_workers
+        self.cache_dir = os.path.expanduser(cache_dir) if cache_dir else None
+        self.cache_ttl = cache_ttl
         
         # Validate credentials
         self._validate_credentials()
@@ -43,52 +230,322 @@ class JiraAnalyticsTool:
         """
         Establish connection to Jira instance
         
+        The client owns a single requests session, so TLS connections are
+        pooled and kept alive across every search page. Its connection pool
+        is sized to max_workers so concurrent page fetches never open and
+        discard extra connections.
+        
         Returns:
             JIRA: Authenticated Jira client
         """
         try:
             jira = JIRA(
                 server=self.jira_server,
-                basic_auth=(self.username, self.api_token)
+                basic_auth=(self.username, self.api_token),
+                # Searching doesn't depend on the server version, so skip the serverInfo round-trip
+                get_server_info=False
+            )
+            # The client's ResilientSession only retries 429s and connection errors,
+            # so transient 5xx responses to search GETs are retried by the adapter
+            adapter = HTTPAdapter(
+                pool_maxsize=self.max_workers,
+                max_retries=Retry(
+                    total=3,
+                    backoff_factor=0.3,
+                    status_forcelist=[500, 502, 503, 504],
+                    allowed_methods=frozenset({'GET'})
+                )
             )
+            jira._session.mount('https://', adapter)
+            jira._session.mount('http://', adapter)
             print("Successfully connected to Jira!")
             return jira
         except Exception as e:
             print(f"Error connecting to Jira: {e}")
             raise
 
-    def fetch_issues(self, jql_query: str, max_results: Optional[int] = None) -> List[Dict[str, Any]]:
+    def _search_page(self, 
+                     jql_query: str, 
+                     start_at: int, 
+                     page_size: int, 
+                     fields: str = _SUMMARY_FIELDS_STR) -> Dict[str, Any]:
         """
-        Fetch Jira issues directly using a JQL query
+        Fetch a single page of raw issue JSON
+        
+        Args:
+            jql_query (str): Jira Query Language (JQL) query
+            start_at (int): Index of the first issue in the page
+            page_size (int): Number of issues to request
+            fields (str): Comma-separated Jira field ids to request
+        
+        Returns:
+            Dict[str, Any]: Raw search response with 'total' and 'issues'
+        """
+        return self.jira_client.search_issues(
+            jql_query, 
+            startAt=start_at,
+            maxResults=page_size,
+            fields=fields,
+            expand=None,
+            json_result=True
+        )
+
+    def _cache_path(self, 
+                    jql_query: str, 
+                    max_results: Optional[int] = None, 
+                    fields: str = _SUMMARY_FIELDS_STR) -> Optional[str]:
+        """
+        Locate the cache file for a search
+        
+        The cache key covers the Jira server and user as well as the search
+        itself, so a shared cache directory never serves one server's or
+        user's results to another.
         
         Args:
             jql_query (str): Jira Query Language (JQL) query
             max_results (Optional[int]): Maximum number of issues to fetch
+            fields (str): Comma-separated Jira field ids to request
         
         Returns:
-            List[Dict[str, Any]]: List of issue dictionaries
+            Optional[str]: Cache file path, or None if caching is disabled
         """
-        # Determine max results
+        if not self.cache_dir:
+            return None
         if max_results is None or max_results <= 0:
             max_results = None
+        # Results depend on the instance and on what the user is allowed to see
+        key = hashlib.sha1(
+            f"{self.jira_server}|{self.username}|{jql_query}|{fields}|{max_results}".encode()
+        ).hexdigest()
+        return os.path.join(self.cache_dir, f"{key}.jsonl")
+
+    def _cache_is_fresh(self, path: Optional[str]) -> bool:
+        """
+        Check whether a cache file exists and is younger than cache_ttl
+        
+        Args:
+            path (Optional[str]): Cache file path
         
+        Returns:
+            bool: True if the cached search results can be used
+        """
         try:
-            print(f"Executing JQL Query: {jql_query}")
-            
-            # Fetch issues with all relevant fields
-            issues = self.jira_client.search_issues(
-                jql_query, 
-                maxResults=max_results,
-                fields=[
-                    'summary', 'status', 'priority', 'issuetype', 'created', 
-                    'updated', 'resolved', 'assignee', 'reporter', 
-                    'project', 'fixVersion', 'components', 'labels', 
-                    'environment', 'resolution', 'timeSpent', 'description'
-                ]
-            )
+            return path is not None and time.time() - os.path.getmtime(path) < self.cache_ttl
+        except OSError:
+            return False
+
+    @staticmethod
+    def _read_cache(path: str, batch_size: int = 1000) -> Iterator[List[Dict[str, Any]]]:
+        """
+        Yield cached raw issues in pages
+        
+        Args:
+            path (str): Cache file path
+            batch_size (int): Number of issues per page
+        
+        Yields:
+            List[Dict[str, Any]]: Raw issue dictionaries of one page, in result order
+        """
+        print(f"Using cached results from {path}")
+        with open(path, encoding='utf-8') as cache:
+            while True:
+                page = [json.loads(line) for line in islice(cache, batch_size)]
+                if not page:
+                    return
+                yield page
+
+    @staticmethod
+    @contextmanager
+    def _write_cache(path: str) -> Iterator[TextIO]:
+        """
+        Open a cache file for writing, one raw issue JSON per line
+        
+        The file is written under a temporary name and only moved into
+        place once the block completes, so an interrupted search never
+        leaves a partial result behind.
+        
+        Args:
+            path (str): Cache file path
+        
+        Yields:
+            TextIO: Temporary file to write issue lines to
+        """
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as cache:
+                yield cache
+            os.replace(tmp_path, path)
+        except BaseException:
+            os.remove(tmp_path)
+            raise
+
+    def _iter_raw_pages(self, 
+                        jql_query: str, 
+                        max_results: Optional[int] = None, 
+                        batch_size: int = 1000,
+                        fields: str = _SUMMARY_FIELDS_STR) -> Iterator[List[Dict[str, Any]]]:
+        """
+        Yield pages of raw issue JSON for a JQL query, using the cache if enabled
+        
+        Args:
+            jql_query (str): Jira Query Language (JQL) query
+            max_results (Optional[int]): Maximum number of issues to fetch
+            batch_size (int): Number of issues to request per page
+            fields (str): Comma-separated Jira field ids to request
+        
+        Yields:
+            List[Dict[str, Any]]: Raw issue dictionaries of one page, in result order
+        """
+        path = self._cache_path(jql_query, max_results, fields)
+        if self._cache_is_fresh(path):
+            yield from self._read_cache(path, batch_size)
+            return
+        
+        pages = self._search_raw_pages(jql_query, max_results, batch_size, fields)
+        if path is None:
+            yield from pages
+            return
+        
+        # Save each page as it streams past
+        with self._write_cache(path) as cache:
+            for page in pages:
+                cache.writelines(f"{json.dumps(issue)}\n" for issue in page)
+                yield page
+
+    def _search_raw_pages(self, 
+                          jql_query: str, 
+                          max_results: Optional[int] = None, 
+                          batch_size: int = 1000,
+                          fields: str = _SUMMARY_FIELDS_STR) -> Iterator[List[Dict[str, Any]]]:
+        """
+        Yield pages of raw issue JSON for a JQL query from Jira
+        
+        Issues are requested page by page using explicit startAt/maxResults
+        offsets. Jira Data Center accepts pages of up to 1000 issues; Jira
+        Cloud caps pages at 100, in which case the server's page size is
+        adopted after the first response. The first page also reports the
+        total number of matches, after which the following pages are fetched
+        concurrently on up to max_workers threads, staying at most
+        max_workers pages ahead of the consumer.
+        
+        Args:
+            jql_query (str): Jira Query Language (JQL) query
+            max_results (Optional[int]): Maximum number of issues to fetch
+            batch_size (int): Number of issues to request per page
+            fields (str): Comma-separated Jira field ids to request
+        
+        Yields:
+            List[Dict[str, Any]]: Raw issue dictionaries of one page, in result order
+        """
+        # Determine max results
+        if max_results is None or max_results <= 0:
+            max_results = None
+        
+        # The first page tells us how many issues match
+        page_size = batch_size if max_results is None else min(batch_size, max_results)
+        response = self._search_page(jql_query, 0, page_size, fields)
+        first_page = response.get('issues', [])
+        total = response.get('total', 0)
+        if max_results is not None:
+            total = min(total, max_results)
+        
+        # The server may silently cap the page size (e.g. 100 on Jira Cloud)
+        if 0 < len(first_page) < page_size and len(first_page) < total:
+            print(f"Warning: requested {page_size} issues per page but the server "
+                  f"returned {len(first_page)}. Using a batch size of {len(first_page)}.")
+            batch_size = len(first_page)
+        
+        if not first_page:
+            return
+        yield first_page
+        
+        # Fetch the remaining pages concurrently, handing them out in offset order
+        offsets = iter(range(len(first_page), total, batch_size))
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            def submit(offset: int) -> Future:
+                return executor.submit(self._search_page, jql_query, offset, 
+                                       min(batch_size, total - offset), fields)
             
-            # Format and return issues
-            formatted_issues = [self._format_issue(issue) for issue in issues]
+            pending = deque(submit(offset) for offset in islice(offsets, self.max_workers))
+            try:
+                while pending:
+                    page = pending.popleft().result().get('issues', [])
+                    pending.extend(submit(offset) for offset in islice(offsets, 1))
+                    yield page
+            finally:
+                # Don't keep fetching pages if the consumer stopped early
+                for future in pending:
+                    future.cancel()
+
+    def _fetch_raw_issues(self, 
+                          jql_query: str, 
+                          max_results: Optional[int] = None, 
+                          batch_size: int = 1000,
+                          fields: str = _SUMMARY_FIELDS_STR) -> List[Dict[str, Any]]:
+        """
+        Fetch raw issue JSON for a JQL query, using the cache if enabled
+        
+        Pages come from the same paging engine and cache as iter_issues and
+        are flattened in result order.
+        
+        Args:
+            jql_query (str): Jira Query Language (JQL) query
+            max_results (Optional[int]): Maximum number of issues to fetch
+            batch_size (int): Number of issues to request per page
+            fields (str): Comma-separated Jira field ids to request
+        
+        Returns:
+            List[Dict[str, Any]]: Raw issue dictionaries in result order
+        """
+        return [issue for page in self._iter_raw_pages(jql_query, max_results, batch_size, fields) 
+                for issue in page]
+
+    def iter_issues(self, 
+                    jql_query: str, 
+                    max_results: Optional[int] = None, 
+                    batch_size: int = 1000,
+                    include_text: bool = False) -> Iterator[Dict[str, Any]]:
+        """
+        Stream Jira issues for a JQL query
+        
+        Issues are formatted and yielded as soon as their page arrives, so
+        callers can print or export them while later pages are still being
+        fetched, without holding the whole result set in memory.
+        
+        Args:
+            jql_query (str): Jira Query Language (JQL) query
+            max_results (Optional[int]): Maximum number of issues to fetch
+            batch_size (int): Number of issues to request per page
+            include_text (bool): Also fetch the long Description and Environment text
+        
+        Yields:
+            Dict[str, Any]: Formatted issue dictionaries in result order
+        """
+        print(f"Executing JQL Query: {jql_query}")
+        fields = _FIELDS_STR if include_text else _SUMMARY_FIELDS_STR
+        for page in self._iter_raw_pages(jql_query, max_results, batch_size, fields):
+            yield from (self._format_issue(issue, include_text) for issue in page)
+
+    def fetch_issues(self, 
+                     jql_query: str, 
+                     max_results: Optional[int] = None, 
+                     batch_size: int = 1000,
+                     include_text: bool = False) -> List[Dict[str, Any]]:
+        """
+        Fetch Jira issues directly using a JQL query
+        
+        Args:
+            jql_query (str): Jira Query Language (JQL) query
+            max_results (Optional[int]): Maximum number of issues to fetch
+            batch_size (int): Number of issues to request per page
+            include_text (bool): Also fetch the long Description and Environment text
+        
+        Returns:
+            List[Dict[str, Any]]: List of issue dictionaries
+        """
+        try:
+            formatted_issues = list(self.iter_issues(jql_query, max_results, batch_size, include_text))
             print(f"Found {len(formatted_issues)} issues")
             return formatted_issues
         
@@ -96,96 +553,191 @@ class JiraAnalyticsTool:
             print(f"Error fetching issues: {e}")
             return []
 
-    def _format_issue(self, issue) -> Dict[str, Any]:
+    def fetch_issues_dataframe(self, 
+                               jql_query: str, 
+                               max_results: Optional[int] = None, 
+                               batch_size: int = 1000,
+                               include_text: bool = False) -> pd.DataFrame:
+        """
+        Fetch Jira issues for a JQL query as a DataFrame
+        
+        Each output column is built as one list straight from the raw
+        issues, instead of building one dictionary per issue and letting
+        pandas scan them row by row.
+        
+        Args:
+            jql_query (str): Jira Query Language (JQL) query
+            max_results (Optional[int]): Maximum number of issues to fetch
+            batch_size (int): Number of issues to request per page
+            include_text (bool): Also fetch the long Description and Environment text
+        
+        Returns:
+            pd.DataFrame: One row per issue, with the same columns as fetch_issues
+        """
+        try:
+            print(f"Executing JQL Query: {jql_query}")
+            
+            fields = _FIELDS_STR if include_text else _SUMMARY_FIELDS_STR
+            raw_issues = self._fetch_raw_issues(jql_query, max_results, batch_size, fields)
+            df = self._normalize_issues(raw_issues, include_text)
+            print(f"Found {len(df)} issues")
+            return df
+        
+        except Exception as e:
+            print(f"Error fetching issues: {e}")
+            return self._normalize_issues([], include_text)
+
+    def _format_issue(self, issue: Dict[str, Any], include_text: bool = False) -> Dict[str, Any]:
         """
         Format Jira issue for easier consumption
         
         Args:
-            issue: Jira issue object
+            issue (Dict[str, Any]): Raw Jira issue JSON as returned by the search API
+            include_text (bool): Include the Description and Environment columns
         
         Returns:
             Dict[str, Any]: Formatted issue dictionary
         """
-        return {
-            'Issue Key': issue.key,
-            'Summary': issue.fields.summary,
-            'Description': getattr(issue.fields, 'description', ''),
-            'Status': str(issue.fields.status),
-            'Priority': str(issue.fields.priority),
-            'Issue Type': str(issue.fields.issuetype),
-            'Created Date': str(issue.fields.created),
-            'Updated Date': str(issue.fields.updated),
-            'Resolved Date': str(getattr(issue.fields, 'resolutiondate', None) or ''),
-            'Assignee': str(issue.fields.assignee) if issue.fields.assignee else 'Unassigned',
-            'Reporter': str(issue.fields.reporter),
-            'Project': str(issue.fields.project),
-            'Fix Versions': ', '.join([str(v) for v in issue.fields.fixVersions]) if issue.fields.fixVersions else '',
-            'Components': ', '.join([str(c) for c in issue.fields.components]) if issue.fields.components else '',
-            'Labels': ', '.join(issue.fields.labels) if issue.fields.labels else '',
-            'Environment': getattr(issue.fields, 'environment', ''),
-            'Resolution': str(issue.fields.resolution) if issue.fields.resolution else '',
-            'Time Spent': getattr(issue.fields, 'timeSpent', '')
-        }
-
-    def export_to_excel(self, issues: List[Dict[str, Any]], filename: str = 'jira_issues.xlsx'):
+        return self._FORMATTER(issue) if include_text else self._SUMMARY_FORMATTER(issue)
+
+    def _normalize_issues(self, raw_issues: List[Dict[str, Any]], include_text: bool = False) -> pd.DataFrame:
+        """
+        Build a formatted DataFrame from raw Jira issue JSON
+        
+        Columns are filled one at a time by the generated column builders
+        and handed to pandas as ready-made lists, so the DataFrame is
+        assembled per column rather than per row.
+        
+        Args:
+            raw_issues (List[Dict[str, Any]]): Raw issue dictionaries
+            include_text (bool): Include the Description and Environment columns
+        
+        Returns:
+            pd.DataFrame: Formatted issues, one column per entry of _FIELDS_KEY_MAP
+        """
+        builders = self._COLUMN_BUILDERS if include_text else self._SUMMARY_COLUMN_BUILDERS
+        issue_fields = [issue['fields'] for issue in raw_issues]
+        
+        formatted = {'Issue Key': [issue['key'] for issue in raw_issues]}
+        formatted.update({column: build(issue_fields) for column, build in builders})
+        return pd.DataFrame(formatted, columns=list(formatted), copy=False)
+
+    def export_to_excel(self, 
+                        issues: Union[Iterable[Dict[str, Any]], pd.DataFrame], 
+                        filename: str = 'jira_issues.xlsx'):
         """
         Export issues to Excel
         
+        Rows are written top to bottom by xlsxwriter in constant memory
+        mode, so each row is flushed to disk as soon as the next one starts
+        and memory use stays flat regardless of the number of issues.
+        Issues fetched with include_text get their Description and
+        Environment written to a separate 'Text' sheet keyed by issue key,
+        keeping the 'Issues' sheet compact.
+        
         Args:
-            issues (List[Dict[str, Any]]): List of issue dictionaries
+            issues (Union[Iterable[Dict[str, Any]], pd.DataFrame]): Issue dictionaries
+                from fetch_issues or iter_issues, or a DataFrame from fetch_issues_dataframe
             filename (str): Output Excel filename
         """
         try:
             # Ensure the directory exists
             os.makedirs(os.path.dirname(os.path.abspath(filename)), exist_ok=True)
             
-            # Create DataFrame and export
-            df = pd.DataFrame(issues)
-            df.to_excel(filename, index=False)
+            if isinstance(issues, pd.DataFrame):
+                headers = list(issues.columns)
+                rows = issues.itertuples(index=False, name=None)
+            else:
+                # Peek at the first issue for the headers without consuming a stream
+                issues = iter(issues)
+                first = next(issues, None)
+                headers = list(first.keys()) if first else []
+                # Look up a whole row with one precomputed getter instead of a get per cell
+                rows = map(_row_getter(headers), chain((first,), issues)) if headers else ()
+            
+            # Long text columns go to their own sheet, linked back by issue key
+            text_indices = [i for i, header in enumerate(headers) if header in self._TEXT_COLUMNS]
+            if text_indices:
+                key_indices = [i for i, header in enumerate(headers) if header == 'Issue Key']
+                layout = [('Issues', [i for i in range(len(headers)) if i not in text_indices]),
+                          ('Text', key_indices + text_indices)]
+            else:
+                layout = [('Issues', list(range(len(headers))))]
+            
+            workbook = xlsxwriter.Workbook(filename, {'constant_memory': True})
+            bold = workbook.add_format({'bold': True})
+            sheets = []
+            for name, indices in layout:
+                worksheet = workbook.add_worksheet(name)
+                if indices:
+                    # Column layout must be set before any rows are flushed
+                    get_columns = _row_getter(indices)
+                    worksheet.set_column(0, len(indices) - 1, 20)
+                    worksheet.freeze_panes(1, 0)
+                    worksheet.write_row(0, 0, get_columns(headers), bold)
+                    sheets.append((worksheet, get_columns))
+            
+            # Each sheet flushes its own rows, so they can be filled side by side
+            for row, values in enumerate(rows, start=1):
+                for worksheet, get_columns in sheets:
+                    worksheet.write_row(row, 0, get_columns(values))
+            workbook.close()
             print(f"Issues exported to {filename}")
         
         except Exception as e:
             print(f"Error exporting to Excel: {e}")
             raise
 
-    def get_project_issues(self, project_key: str, max_results: Optional[int] = None) -> List[Dict[str, Any]]:
+    def get_project_issues(self, 
+                           project_key: str, 
+                           max_results: Optional[int] = None,
+                           include_text: bool = False) -> List[Dict[str, Any]]:
         """
         Fetch all issues for a specific project
         
         Args:
             project_key (str): Jira project key
             max_results (Optional[int]): Maximum number of issues to fetch
+            include_text (bool): Also fetch the long Description and Environment text
         
         Returns:
             List[Dict[str, Any]]: List of project issues
         """
         jql_query = f"project = {project_key}"
-        return self.fetch_issues(jql_query, max_results)
+        return self.fetch_issues(jql_query, max_results, include_text=include_text)
 
-    def get_issues_by_status(self, status: str, max_results: Optional[int] = None) -> List[Dict[str, Any]]:
+    def get_issues_by_status(self, 
+                             status: str, 
+                             max_results: Optional[int] = None,
+                             include_text: bool = False) -> List[Dict[str, Any]]:
         """
         Fetch issues by their status
         
         Args:
             status (str): Issue status (e.g., 'Open', 'In Progress', 'Closed')
             max_results (Optional[int]): Maximum number of issues to fetch
+            include_text (bool): Also fetch the long Description and Environment text
         
         Returns:
             List[Dict[str, Any]]: List of issues with specified status
         """
         jql_query = f"status = '{status}'"
-        return self.fetch_issues(jql_query, max_results)
+        return self.fetch_issues(jql_query, max_results, include_text=include_text)
 
-    def get_issues_by_assignee(self, assignee: str, max_results: Optional[int] = None) -> List[Dict[str, Any]]:
+    def get_issues_by_assignee(self, 
+                               assignee: str, 
+                               max_results: Optional[int] = None,
+                               include_text: bool = False) -> List[Dict[str, Any]]:
         """
         Fetch issues assigned to a specific user
         
         Args:
             assignee (str): Assignee username
             max_results (Optional[int]): Maximum number of issues to fetch
+            include_text (bool): Also fetch the long Description and Environment text
         
         Returns:
             List[Dict[str, Any]]: List of issues assigned to the user
         """
         jql_query = f"assignee = '{assignee}'"
-        return self.fetch_issues(jql_query, max_results)
\ No newline at end of file
+        return self.fetch_issues(jql_query, max_results, include_text=include_text)
\ No newline at end of file